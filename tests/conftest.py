@@ -0,0 +1,41 @@
+import os
+
+# Headless drivers must be chosen before pygame is imported, including on xdist workers.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_session():
+    """Initialize pygame once per session with a dummy display for headless CI."""
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def draw_surface():
+    """Provide one shared 100x100 surface for draw tests that only blit onto it."""
+    return pygame.Surface((100, 100))
+
+
+@pytest.fixture(scope="session")
+def default_font():
+    """Provide pygame's default 24pt font, loaded once per session."""
+    return pygame.font.Font(None, 24)
+
+
+@pytest.fixture(scope="session")
+def score_surface():
+    """Provide one shared 200x40 surface sized like the score display area."""
+    return pygame.Surface((200, 40))
+
+
+@pytest.fixture(scope="session")
+def timer_surface():
+    """Provide one shared 100x30 surface sized like the timer display area."""
+    return pygame.Surface((100, 30))
@@ -1,8 +1,6 @@
-import os
+from types import SimpleNamespace
 from unittest.mock import Mock
 
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-
 import pygame
 import pytest
 
@@ -17,13 +15,34 @@ from xboing.game.bullet_manager import BulletManager
 from xboing.game.paddle import Paddle
 
 
-@pytest.fixture(autouse=True)
-def pygame_setup():
-    """Initialize pygame for all tests with dummy video driver for headless CI."""
-    pygame.init()
-    pygame.display.set_mode((800, 600))
-    yield
-    pygame.quit()
+@pytest.fixture(scope="session")
+def play_rect():
+    """Provide an 800x600 play area stand-in; controllers only read its geometry."""
+    return SimpleNamespace(width=800, height=600, x=0, y=0)
+
+
+@pytest.fixture(scope="session")
+def block_rect():
+    """Provide one shared block rect; tests only hand it to block mocks to read."""
+    return pygame.Rect(400, 450, 32, 16)
+
+
+@pytest.fixture(scope="session")
+def paddle_rect():
+    """Provide one shared paddle rect; paddles mutate theirs, so assign a copy."""
+    return pygame.Rect(390, 550, 40, 10)
+
+
+@pytest.fixture(scope="session")
+def k_key_event():
+    """Provide a K keydown event for the firing and ball launch tests."""
+    return SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_k)
+
+
+@pytest.fixture(scope="session")
+def mouse_button_event():
+    """Provide a mouse button down event for the ball launch tests."""
+    return SimpleNamespace(type=pygame.MOUSEBUTTONDOWN)
 
 
 @pytest.fixture
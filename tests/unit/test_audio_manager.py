@@ -21,7 +21,6 @@ class UnrelatedEvent(XBoingEvent):
 
 
 def make_manager():
-    pygame.init()  # Initialize pygame for events
     mgr = AudioManager(sound_dir="/fake/dir")
     return mgr
 
@@ -1,5 +1,4 @@
 import pygame
-import pytest
 
 from xboing.engine.events import BallLostEvent, PaddleHitEvent, WallHitEvent
 from xboing.game.ball import Ball
@@ -14,14 +13,6 @@ from xboing.game.protocols import (
 )
 
 
-@pytest.fixture(autouse=True)
-def pygame_init():
-    pygame.init()
-    pygame.display.set_mode((1, 1))
-    yield
-    pygame.quit()
-
-
 def test_ball_inheritance_and_protocols():
     """Test that Ball inherits from CircularGameShape and implements all required protocols."""
     b = Ball(10, 20)
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Test the mapping between level file characters and block types."""
 
-import pygame
 import pytest
 
 from xboing.game.block import Block, CounterBlock
@@ -23,9 +22,6 @@ from xboing.utils.block_type_loader import BlockTypeData, get_block_types
 @pytest.fixture
 def setup_level_manager():
     """Set up the level manager and block manager for testing."""
-    # Initialize pygame (needed for SpriteBlock)
-    pygame.init()
-
     # Create managers
     block_manager = BlockManager(0, 0)
     level_manager = LevelManager()
@@ -109,7 +105,6 @@ def test_char_to_block_type_mapping():
 
 
 def test_block_removal_after_explosion_animation():
-    pygame.init()
     block_manager = BlockManager(0, 0)
     block_types = get_block_types()
     # Create a single block
@@ -1,16 +1,8 @@
 import pygame
-import pytest
 
 from xboing.game.bullet import Bullet
 
 
-@pytest.fixture(autouse=True)
-def pygame_init():
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 def test_bullet_creation():
     b = Bullet(10, 20, vx=2, vy=-5, radius=4, color=(1, 2, 3))
     assert b.x == 10
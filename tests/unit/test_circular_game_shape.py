@@ -46,10 +46,8 @@ def test_circular_gameshape_get_position():
 
 
 def test_circular_gameshape_draw_called():
-    pygame.init()
     surface = pygame.Surface((50, 50))
     shape = DummyCircularShape(0, 0, 10)
     assert not shape.draw_called
     shape.draw(surface)
     assert shape.draw_called
-    pygame.quit()
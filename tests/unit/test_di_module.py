@@ -1,7 +1,5 @@
 from unittest.mock import Mock
 
-import pygame
-
 from xboing.controllers.game_controller import GameController
 from xboing.di_module import XBoingModule
 from xboing.engine.audio_manager import AudioManager
@@ -21,8 +19,6 @@ from xboing.ui.ui_manager import UIManager
 
 
 def test_di_provides_ammo_components():
-    pygame.display.init()
-    pygame.display.set_mode((1, 1))
     gs = GameState()
     lm = LevelManager()
     bm = BallManager()
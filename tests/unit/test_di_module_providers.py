@@ -1,8 +1,5 @@
 from unittest.mock import Mock
 
-import pygame
-import pytest
-
 from xboing.di_module import XBoingModule
 from xboing.game.ball_manager import BallManager
 from xboing.game.block_manager import BlockManager
@@ -13,14 +10,6 @@ from xboing.game.paddle import Paddle
 from xboing.renderers.bullet_renderer import BulletRenderer
 
 
-@pytest.fixture(autouse=True)
-def pygame_init():
-    pygame.init()
-    pygame.display.set_mode((1, 1))  # Dummy video mode for image loading
-    yield
-    pygame.quit()
-
-
 def make_module():
     gs = GameState()
     lm = LevelManager()
@@ -1,4 +1,5 @@
-import logging
+from collections import defaultdict
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pygame
@@ -37,13 +38,19 @@ from xboing.game.paddle import Paddle
 from xboing.layout.game_layout import GameLayout
 from xboing.utils.block_type_loader import get_block_types
 
-# Set up file logging at the top of the file
-logging.basicConfig(
-    filename="test_debug.log",
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-logger = logging.getLogger(__name__)
+
+def group_events(pygame_events):
+    """Group the custom events carried by pygame events by their type."""
+    grouped = defaultdict(list)
+    for pygame_event in pygame_events:
+        event = getattr(pygame_event, "event", None)
+        grouped[type(event)].append(event)
+    return grouped
+
+
+def group_posted_events(mock_post):
+    """Group the custom events posted through a patched pygame.event.post."""
+    return group_events(call.args[0] for call in mock_post.call_args_list)
 
 
 def make_key_event(key, mod=0):
@@ -110,8 +117,7 @@ def make_mock_ball(x=10, y=20, radius=5, color=(255, 255, 255)):
     return m
 
 
-@pytest.mark.timeout(5)
-def test_ball_launch_logic(game_setup, mock_game_objects):
+def test_ball_launch_logic(game_setup, mouse_button_event):
     """Test ball launch logic with mouse button click."""
     balls = [Mock() for _ in range(2)]
     for b in balls:
@@ -130,8 +136,6 @@ def test_ball_launch_logic(game_setup, mock_game_objects):
     )
 
     with patch("pygame.event.post") as mock_post:
-        # Simulate mouse button down event
-        event = Mock(type=1025)  # pygame.MOUSEBUTTONDOWN
         # Setup level_manager.get_level_info
         game_setup["level_manager"].get_level_info.return_value = {
             "title": "Test Level"
@@ -139,24 +143,16 @@ def test_ball_launch_logic(game_setup, mock_game_objects):
         # Mock set_timer to return an empty list (no events)
         game_setup["game_state"].set_timer.return_value = []
 
-        controller.handle_events([event])
+        # Simulate mouse button down event
+        controller.handle_events([mouse_button_event])
 
         for ball in balls:
             ball.release_from_paddle.assert_called_once()
 
         # Check BallShotEvent and MessageChangedEvent fired
-        assert any(
-            call.args[0].type == pygame.USEREVENT
-            and hasattr(call.args[0], "event")
-            and isinstance(call.args[0].event, BallShotEvent)
-            for call in mock_post.call_args_list
-        )
-        assert any(
-            call.args[0].type == pygame.USEREVENT
-            and hasattr(call.args[0], "event")
-            and isinstance(call.args[0].event, MessageChangedEvent)
-            for call in mock_post.call_args_list
-        )
+        events = group_posted_events(mock_post)
+        assert events[BallShotEvent]
+        assert events[MessageChangedEvent]
 
 
 # Disabled due to persistent hangs in the test environment
@@ -206,12 +202,13 @@ def test_update_balls_and_collisions_bomb(mock_post):
     )
     controller.update_balls_and_collisions(0.016)
     # Should have fired BombExplodedEvent
-    assert any(
-        call.args[0].type == pygame.USEREVENT
-        and hasattr(call.args[0], "event")
-        and isinstance(call.args[0].event, BombExplodedEvent)
-        for call in mock_post.call_args_list
-    )
+    assert group_posted_events(mock_post)[BombExplodedEvent]
+
+
+@pytest.fixture
+def real_paddle():
+    """Provide a real paddle for tests that observe paddle state transitions."""
+    return Paddle(x=400, y=550)
 
 
 @pytest.fixture
@@ -219,7 +216,13 @@ def game_setup(mock_game_objects):
     """Set up game objects for tests."""
     game_state = Mock()
     level_manager = Mock()
-    paddle = Paddle(x=400, y=550)  # Position paddle in a reasonable place
+    # Mirrors the attributes of a default Paddle(x=400, y=550)
+    paddle = Mock(
+        spec=Paddle,
+        width=70,
+        size=Paddle.SIZE_LARGE,
+        rect=pygame.Rect(365, 550, 70, 15),
+    )
     block_manager = BlockManager(0, 0)
     renderer = Mock()
     input_manager = Mock()
@@ -241,24 +244,35 @@ def game_setup(mock_game_objects):
     }
 
 
-@pytest.mark.timeout(5)  # Add timeout to prevent hanging
-def test_update_balls_and_collisions_timer(game_setup, mock_game_objects):
-    """Test timer block collision handling."""
+def test_update_balls_and_collisions_timer(
+    game_setup, monkeypatch, play_rect, block_rect
+):
+    """Test that hitting a timer block dispatches its effect to the power-up manager."""
     ball = Ball(x=400, y=500, radius=8)  # Position ball near paddle
     ball.vx = 0
     ball.vy = -200  # Moving upward
+    ball.get_collision_type = Mock(return_value="ball")
+    ball.handle_collision = Mock()
+    ball.update = Mock(return_value=[])  # Return empty list for update
+    ball.collides_with = Mock(return_value=True)  # Always collide
 
     game_setup["ball_manager"].add_ball(ball)
-    game_setup["block_manager"].check_collisions.side_effect = [(0, 0, [TIMER_BLK])] + [
-        (0, 0, [])
-    ] * 10
 
-    # Setup game state timer
-    level_state = Mock()
-    level_state.timer = 0
-    level_state.get_bonus_time.return_value = 20
-    game_setup["game_state"].level_state = level_state
-    game_setup["game_state"].set_timer.return_value = []
+    # Create a timer block that breaks on the first hit
+    block = Mock()
+    block.get_collision_type = Mock(return_value="block")
+    block.is_active = Mock(return_value=True)
+    block.rect = block_rect  # Direct attribute, not method
+    block.get_rect = Mock(return_value=block_rect)
+    block.state = "normal"  # Required by collision handler
+    block.hit_this_frame = False  # Required by collision handler
+    block.type = TIMER_BLK
+    block.hit = Mock(return_value=(True, 0, TIMER_BLK))  # Return effect when hit
+    block.collides_with = Mock(return_value=True)  # Always collide
+    game_setup["block_manager"].blocks = [block]
+
+    # Set up play rect for ball update
+    game_setup["layout"].get_play_rect.return_value = play_rect
 
     controller = GameController(
         game_setup["game_state"],
@@ -271,16 +285,23 @@ def test_update_balls_and_collisions_timer(game_setup, mock_game_objects):
         renderer=game_setup["renderer"],
         bullet_manager=game_setup["bullet_manager"],
     )
+    handle_power_up_effect = Mock(return_value=[])
+    monkeypatch.setattr(
+        controller.power_up_manager, "handle_power_up_effect", handle_power_up_effect
+    )
 
-    with patch("pygame.event.post"):
+    with patch("pygame.event.post") as mock_post:
         controller.update_balls_and_collisions(0.016)
 
-    assert game_setup["game_state"].level_state.get_bonus_time() == 20
+    block.hit.assert_called_once()
+    handle_power_up_effect.assert_called_once_with(TIMER_BLK, block)
+    # Special blocks report through their effect, not a plain BlockHitEvent
+    assert not group_posted_events(mock_post)[BlockHitEvent]
 
 
-@pytest.mark.timeout(5)
-def test_paddle_expand_event_fired(game_setup, mock_game_objects):
+def test_paddle_expand_event_fired(game_setup, real_paddle, play_rect, block_rect):
     """Test that hitting a pad expand block increases paddle size and fires PaddleGrowEvent."""
+    game_setup["paddle"] = real_paddle
     ball = Ball(x=400, y=500, radius=8)
     ball.vx = 0
     ball.vy = -200  # Moving upward
@@ -296,8 +317,8 @@ def test_paddle_expand_event_fired(game_setup, mock_game_objects):
     block = Mock()
     block.get_collision_type = Mock(return_value="block")
     block.is_active = Mock(return_value=True)
-    block.rect = pygame.Rect(400, 450, 32, 16)  # Direct attribute, not method
-    block.get_rect = Mock(return_value=block.rect)
+    block.rect = block_rect  # Direct attribute, not method
+    block.get_rect = Mock(return_value=block_rect)
     block.state = "normal"  # Required by collision handler
     block.hit_this_frame = False  # Required by collision handler
     block.type = PAD_EXPAND_BLK
@@ -306,11 +327,6 @@ def test_paddle_expand_event_fired(game_setup, mock_game_objects):
     game_setup["block_manager"].blocks = [block]
 
     # Set up play rect for ball update
-    play_rect = Mock()
-    play_rect.width = 800
-    play_rect.height = 600
-    play_rect.x = 0
-    play_rect.y = 0
     game_setup["layout"].get_play_rect.return_value = play_rect
 
     controller = GameController(
@@ -329,15 +345,13 @@ def test_paddle_expand_event_fired(game_setup, mock_game_objects):
     events = controller.collision_handlers.handle_ball_block_collision(ball, block)
 
     # Verify PaddleGrowEvent was returned
-    paddle_grow_events = [
-        event for event in events if isinstance(event.event, PaddleGrowEvent)
-    ]
-    assert len(paddle_grow_events) == 1, "Expected exactly one PaddleGrowEvent"
+    grouped = group_events(events)
+    assert len(grouped[PaddleGrowEvent]) == 1, "Expected exactly one PaddleGrowEvent"
 
 
-@pytest.mark.timeout(5)
-def test_paddle_shrink_event_fired(game_setup, mock_game_objects):
+def test_paddle_shrink_event_fired(game_setup, real_paddle, play_rect, block_rect):
     """Test that hitting a pad shrink block decreases paddle size and fires PaddleShrinkEvent."""
+    game_setup["paddle"] = real_paddle
     ball = Ball(x=400, y=500, radius=8)
     ball.vx = 0
     ball.vy = -200  # Moving upward
@@ -353,8 +367,8 @@ def test_paddle_shrink_event_fired(game_setup, mock_game_objects):
     block = Mock()
     block.get_collision_type = Mock(return_value="block")
     block.is_active = Mock(return_value=True)
-    block.rect = pygame.Rect(400, 450, 32, 16)  # Direct attribute, not method
-    block.get_rect = Mock(return_value=block.rect)
+    block.rect = block_rect  # Direct attribute, not method
+    block.get_rect = Mock(return_value=block_rect)
     block.state = "normal"  # Required by collision handler
     block.hit_this_frame = False  # Required by collision handler
     block.type = PAD_SHRINK_BLK
@@ -363,11 +377,6 @@ def test_paddle_shrink_event_fired(game_setup, mock_game_objects):
     game_setup["block_manager"].blocks = [block]
 
     # Set up play rect for ball update
-    play_rect = Mock()
-    play_rect.width = 800
-    play_rect.height = 600
-    play_rect.x = 0
-    play_rect.y = 0
     game_setup["layout"].get_play_rect.return_value = play_rect
 
     controller = GameController(
@@ -386,17 +395,16 @@ def test_paddle_shrink_event_fired(game_setup, mock_game_objects):
     events = controller.collision_handlers.handle_ball_block_collision(ball, block)
 
     # Verify PaddleShrinkEvent was returned
-    paddle_shrink_events = [
-        event for event in events if isinstance(event.event, PaddleShrinkEvent)
-    ]
-    assert len(paddle_shrink_events) == 1, "Expected exactly one PaddleShrinkEvent"
+    grouped = group_events(events)
+    assert (
+        len(grouped[PaddleShrinkEvent]) == 1
+    ), "Expected exactly one PaddleShrinkEvent"
     assert (
         game_setup["paddle"].size == Paddle.SIZE_SMALL
     ), "Paddle should be small after shrinking"
 
 
-@pytest.mark.timeout(5)
-def test_sticky_paddle_activation_event(game_setup, mock_game_objects):
+def test_sticky_paddle_activation_event(game_setup, play_rect, block_rect):
     """Test that hitting a sticky block activates sticky paddle and fires event."""
     ball = Ball(x=400, y=500, radius=8)
     ball.vx = 0
@@ -412,8 +420,8 @@ def test_sticky_paddle_activation_event(game_setup, mock_game_objects):
     block = Mock()
     block.get_collision_type = Mock(return_value="block")
     block.is_active = Mock(return_value=True)
-    block.rect = pygame.Rect(400, 450, 32, 16)  # Direct attribute, not method
-    block.get_rect = Mock(return_value=block.rect)
+    block.rect = block_rect  # Direct attribute, not method
+    block.get_rect = Mock(return_value=block_rect)
     block.state = "normal"  # Required by collision handler
     block.hit_this_frame = False  # Required by collision handler
     block.type = STICKY_BLK
@@ -422,11 +430,6 @@ def test_sticky_paddle_activation_event(game_setup, mock_game_objects):
     game_setup["block_manager"].blocks = [block]
 
     # Set up play rect for ball update
-    play_rect = Mock()
-    play_rect.width = 800
-    play_rect.height = 600
-    play_rect.x = 0
-    play_rect.y = 0
     game_setup["layout"].get_play_rect.return_value = play_rect
 
     controller = GameController(
@@ -445,34 +448,45 @@ def test_sticky_paddle_activation_event(game_setup, mock_game_objects):
     events = controller.collision_handlers.handle_ball_block_collision(ball, block)
 
     # Verify SpecialStickyChangedEvent was returned
-    sticky_events = [
-        event for event in events if isinstance(event.event, SpecialStickyChangedEvent)
-    ]
+    sticky_events = group_events(events)[SpecialStickyChangedEvent]
     assert len(sticky_events) == 1, "Expected exactly one SpecialStickyChangedEvent"
-    assert (
-        sticky_events[0].event.active is True
-    ), "Sticky paddle should be activated"
+    assert sticky_events[0].active is True, "Sticky paddle should be activated"
 
 
-@pytest.mark.timeout(5)
-def test_lives_display_and_game_over_event_order():
-    """Test that LivesChangedEvent(0) is posted before GameOverEvent when last ball is lost."""
-    # Set up real game objects
+@pytest.fixture(scope="session")
+def real_game_env():
+    """Build the real layout, game objects and renderer once per session.
+
+    Tests must reset any state they mutate (for example the ball manager)
+    and create their own GameState.
+    """
     layout = GameLayout(565, 710)
-    game_objects = create_game_objects(layout)
+    surface = pygame.Surface((800, 600))  # Use fixed size for test
+    return SimpleNamespace(
+        layout=layout,
+        objects=create_game_objects(layout),
+        surface=surface,
+        input_manager=InputManager(),
+        renderer=Renderer(surface),
+    )
+
+
+def test_lives_display_and_game_over_event_order(real_game_env):
+    """Test that LivesChangedEvent(0) is posted before GameOverEvent when last ball is lost."""
+    game_objects = real_game_env.objects
+    game_objects["ball_manager"].clear()
     game_state = GameState()
     game_state.lives = 1
 
-    surface = pygame.Surface((800, 600))  # Use fixed size for test
     controller = GameController(
         game_state,
         game_objects["level_manager"],
         game_objects["ball_manager"],
         game_objects["paddle"],
         game_objects["block_manager"],
-        input_manager=InputManager(),
-        layout=layout,
-        renderer=Renderer(surface),
+        input_manager=real_game_env.input_manager,
+        layout=real_game_env.layout,
+        renderer=real_game_env.renderer,
         bullet_manager=game_objects["bullet_manager"],
     )
 
@@ -504,8 +518,7 @@ def test_lives_display_and_game_over_event_order():
         ), "GameOverEvent should be posted second"
 
 
-@pytest.mark.timeout(5)
-def test_arrow_key_movement_reversed(game_setup, mock_game_objects):
+def test_arrow_key_movement_reversed(game_setup):
     """Test that paddle movement is reversed when reverse mode is active."""
     game_setup["paddle"].move_to = Mock()
     game_setup["paddle"].set_direction = Mock()
@@ -539,17 +552,13 @@ def test_arrow_key_movement_reversed(game_setup, mock_game_objects):
     game_setup["paddle"].set_direction.assert_called_with(1)
 
 
-@pytest.mark.timeout(5)
-def test_mouse_movement_reversed(game_setup, mock_game_objects):
+def test_mouse_movement_reversed(game_setup, play_rect):
     """Test that mouse movement is reversed when reverse mode is active."""
     game_setup["paddle"].move_to = Mock()
     game_setup["input_manager"].get_mouse_position = Mock(return_value=(15, 0))
     game_setup["input_manager"].get_mouse_x = Mock(return_value=15)
 
     # Mock play_rect with width 800 for calculation
-    play_rect = Mock()
-    play_rect.width = 800
-    play_rect.x = 0
     game_setup["layout"].get_play_rect.return_value = play_rect
 
     # Mock paddle rect
@@ -584,8 +593,7 @@ def test_mouse_movement_reversed(game_setup, mock_game_objects):
     game_setup["paddle"].move_to.assert_called_with(750, 800, 0)
 
 
-@pytest.mark.timeout(5)
-def test_ball_sticks_to_paddle_when_sticky(game_setup, mock_game_objects):
+def test_ball_sticks_to_paddle_when_sticky(game_setup, play_rect, paddle_rect):
     """Test that ball sticks to paddle when sticky mode is active."""
     ball = Ball(x=400, y=500, radius=8)
     ball.get_collision_type = Mock(return_value="ball")
@@ -597,14 +605,9 @@ def test_ball_sticks_to_paddle_when_sticky(game_setup, mock_game_objects):
     # Set up paddle
     game_setup["paddle"].get_collision_type = Mock(return_value="paddle")
     game_setup["paddle"].is_active = Mock(return_value=True)
-    game_setup["paddle"].rect = pygame.Rect(390, 550, 40, 10)
+    game_setup["paddle"].rect = paddle_rect.copy()
 
     # Set up play rect for ball update
-    play_rect = Mock()
-    play_rect.width = 800
-    play_rect.height = 600
-    play_rect.x = 0
-    play_rect.y = 0
     game_setup["layout"].get_play_rect.return_value = play_rect
 
     controller = GameController(
@@ -632,8 +635,7 @@ def test_ball_sticks_to_paddle_when_sticky(game_setup, mock_game_objects):
     ), "Ball should stick to paddle when sticky mode is active"
 
 
-@pytest.mark.timeout(5)
-def test_ammo_fires_only_with_ball_in_play(game_setup, mock_game_objects):
+def test_ammo_fires_only_with_ball_in_play(game_setup, paddle_rect, k_key_event):
     """Test that ammo only fires when there's a ball in play."""
     ball = Ball(x=400, y=500, radius=8)
     ball.is_active = Mock(return_value=True)
@@ -646,7 +648,7 @@ def test_ammo_fires_only_with_ball_in_play(game_setup, mock_game_objects):
     game_setup["game_state"].fire_ammo = Mock(return_value=[])
 
     # Set up paddle position for bullet creation
-    game_setup["paddle"].rect = pygame.Rect(390, 550, 40, 10)
+    game_setup["paddle"].rect = paddle_rect.copy()
 
     controller = GameController(
         game_setup["game_state"],
@@ -660,23 +662,16 @@ def test_ammo_fires_only_with_ball_in_play(game_setup, mock_game_objects):
         bullet_manager=game_setup["bullet_manager"],
     )
 
-    # Simulate k key press
-    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_k)
-
     with patch("pygame.event.post") as mock_post:
-        controller.handle_events([event])
+        # Simulate k key press
+        controller.handle_events([k_key_event])
 
         # Verify AmmoFiredEvent was posted
-        ammo_events = [
-            call
-            for call in mock_post.call_args_list
-            if isinstance(call.args[0].event, AmmoFiredEvent)
-        ]
+        ammo_events = group_posted_events(mock_post)[AmmoFiredEvent]
         assert len(ammo_events) == 1, "Expected exactly one AmmoFiredEvent"
 
 
-@pytest.mark.timeout(5)
-def test_block_scoring_and_event_on_hit(game_setup, mock_game_objects):
+def test_block_scoring_and_event_on_hit(game_setup, play_rect, block_rect):
     """Test that hitting a block updates score and fires appropriate events."""
     ball = Ball(x=400, y=500, radius=8)
     ball.get_collision_type = Mock(return_value="ball")
@@ -690,8 +685,8 @@ def test_block_scoring_and_event_on_hit(game_setup, mock_game_objects):
     block = Mock()
     block.get_collision_type = Mock(return_value="block")
     block.is_active = Mock(return_value=True)
-    block.rect = pygame.Rect(400, 450, 32, 16)  # Direct attribute
-    block.get_rect = Mock(return_value=block.rect)
+    block.rect = block_rect  # Direct attribute
+    block.get_rect = Mock(return_value=block_rect)
     block.hit = Mock(return_value=(True, 100, None))  # Return score when hit
     block.collides_with = Mock(return_value=True)  # Always collide
     block.state = "normal"  # Required by collision handler
@@ -699,11 +694,6 @@ def test_block_scoring_and_event_on_hit(game_setup, mock_game_objects):
     game_setup["block_manager"].blocks = [block]
 
     # Set up play rect for ball update
-    play_rect = Mock()
-    play_rect.width = 800
-    play_rect.height = 600
-    play_rect.x = 0
-    play_rect.y = 0
     game_setup["layout"].get_play_rect.return_value = play_rect
 
     # Mock add_score to return an empty list of events
@@ -728,14 +718,11 @@ def test_block_scoring_and_event_on_hit(game_setup, mock_game_objects):
     game_setup["game_state"].add_score.assert_called_with(100)
 
     # Verify BlockHitEvent was returned
-    block_hit_events = [
-        event for event in events if isinstance(event.event, BlockHitEvent)
-    ]
+    block_hit_events = group_events(events)[BlockHitEvent]
     assert len(block_hit_events) == 1, "Expected exactly one BlockHitEvent"
 
 
-@pytest.mark.timeout(5)
-def test_collision_system_handlers_integration(game_setup, mock_game_objects):
+def test_collision_system_handlers_integration(game_setup):
     """Test integration of collision system handlers."""
 
     def ball_block_handler(ball_obj, block_obj):
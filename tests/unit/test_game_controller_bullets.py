@@ -1,47 +1,47 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pygame
 import pytest
 
 from xboing.controllers.game_controller import GameController
 from xboing.engine.events import AmmoFiredEvent
-from xboing.game.ball import Ball
 from xboing.game.bullet import Bullet
 
 
-@pytest.fixture(autouse=True)
-def pygame_init():
-    pygame.init()
-    yield
-    pygame.quit()
+class _StubBall:
+    """Minimal ball in play; the firing path only checks these attributes."""
 
+    active = True
+    stuck_to_paddle = False
 
-@pytest.mark.timeout(5)
-def test_fire_bullet_decrements_ammo_and_creates_bullet(game_setup, mock_game_objects):
-    """Test that firing a bullet decrements ammo and creates a bullet object."""
-    # Add a ball in play
-    ball = Ball(x=400, y=500, radius=8)
-    ball.is_active = Mock(return_value=True)
-    game_setup["ball_manager"].add_ball(ball)
+    def is_active(self):
+        return True
 
-    # Set initial ammo
-    game_setup["game_state"].ammo = 2
-    game_setup["game_state"].fire_ammo = Mock(
-        side_effect=lambda: setattr(game_setup["game_state"], "ammo", 1) or []
-    )
 
-    # Set up paddle position for bullet creation
-    game_setup["paddle"].rect = pygame.Rect(390, 550, 40, 10)
+def _recorder(return_value):
+    """Return a function that records its calls and returns return_value."""
+    calls = []
+
+    def record(*args, **kwargs):
+        calls.append((args, kwargs))
+        return return_value
+
+    record.calls = calls
+    return record
+
+
+@pytest.fixture(autouse=True)
+def mock_post(monkeypatch):
+    """Replace pygame.event.post with a Mock for every test in this module."""
+    post = Mock()
+    monkeypatch.setattr(pygame.event, "post", post)
+    return post
 
-    # Set up play rect for bullet update
-    play_rect = Mock()
-    play_rect.width = 800
-    play_rect.height = 600
-    play_rect.x = 0
-    play_rect.y = 0
-    game_setup["layout"].get_play_rect.return_value = play_rect
 
-    controller = GameController(
+@pytest.fixture
+def controller(game_setup):
+    """Build a GameController wired to the shared game_setup objects."""
+    return GameController(
         game_setup["game_state"],
         game_setup["level_manager"],
         game_setup["ball_manager"],
@@ -53,64 +53,50 @@ def test_fire_bullet_decrements_ammo_and_creates_bullet(game_setup, mock_game_ob
         bullet_manager=game_setup["bullet_manager"],
     )
 
-    # Simulate firing bullet
-    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_k)
-
-    with patch("pygame.event.post") as mock_post:
-        controller.handle_events([event])
-
-        assert game_setup["game_state"].ammo == 1, "Ammo should be decremented"
-        assert (
-            len(game_setup["bullet_manager"].bullets) == 1
-        ), "One bullet should be created"
-
-        # Verify AmmoFiredEvent was posted
-        ammo_events = [
-            call
-            for call in mock_post.call_args_list
-            if isinstance(call.args[0].event, AmmoFiredEvent)
-        ]
-        assert len(ammo_events) == 1, "Expected exactly one AmmoFiredEvent"
 
+@pytest.fixture
+def firing_controller(game_setup, controller, play_rect, paddle_rect):
+    """Return the controller with a ball in play and the paddle placed to fire."""
+    game_setup["ball_manager"].add_ball(_StubBall())
+    game_setup["paddle"].rect = paddle_rect.copy()
+    game_setup["layout"].get_play_rect.return_value = play_rect
+    return controller
 
-@pytest.mark.timeout(5)
-def test_fire_bullet_with_no_ammo_does_not_create_bullet(game_setup, mock_game_objects):
-    """Test that attempting to fire with no ammo doesn't create a bullet."""
-    # Add a ball in play
-    ball = Ball(x=400, y=500, radius=8)
-    ball.is_active = Mock(return_value=True)
-    game_setup["ball_manager"].add_ball(ball)
 
-    # Set ammo to 0
-    game_setup["game_state"].ammo = 0
+@pytest.mark.parametrize(
+    "case",
+    [(2, 1, 1, 1), (0, 0, 0, 0)],
+    ids=["with_ammo", "no_ammo"],
+)
+def test_fire_bullet(game_setup, firing_controller, mock_post, k_key_event, case):
+    """Test that firing uses ammo and creates a bullet only while ammo remains."""
+    start_ammo, end_ammo, expected_bullets, expected_ammo_events = case
 
-    controller = GameController(
-        game_setup["game_state"],
-        game_setup["level_manager"],
-        game_setup["ball_manager"],
-        game_setup["paddle"],
-        game_setup["block_manager"],
-        input_manager=game_setup["input_manager"],
-        layout=game_setup["layout"],
-        renderer=game_setup["renderer"],
-        bullet_manager=game_setup["bullet_manager"],
+    # Set initial ammo
+    game_setup["game_state"].ammo = start_ammo
+    game_setup["game_state"].fire_ammo = Mock(
+        side_effect=lambda: setattr(game_setup["game_state"], "ammo", end_ammo) or []
     )
 
-    # Attempt to fire bullet
-    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_k)
+    # Simulate firing bullet
+    firing_controller.handle_events([k_key_event])
 
-    with patch("pygame.event.post") as mock_post:
-        controller.handle_events([event])
+    assert game_setup["game_state"].ammo == end_ammo
+    assert len(game_setup["bullet_manager"].bullets) == expected_bullets
 
-        assert game_setup["game_state"].ammo == 0, "Ammo should remain at 0"
-        assert (
-            len(game_setup["bullet_manager"].bullets) == 0
-        ), "No bullet should be created"
-        assert not mock_post.called, "No event should be posted when out of ammo"
+    # Verify AmmoFiredEvent was posted only when a bullet was fired
+    ammo_events = [
+        call
+        for call in mock_post.call_args_list
+        if isinstance(call.args[0].event, AmmoFiredEvent)
+    ]
+    assert len(ammo_events) == expected_ammo_events
+    assert len(mock_post.call_args_list) == expected_ammo_events
 
 
-@pytest.mark.timeout(5)
-def test_bullet_block_collision_removes_bullet_and_block(game_setup, mock_game_objects):
+def test_bullet_block_collision_removes_bullet_and_block(
+    game_setup, controller, monkeypatch, block_rect
+):
     """Test that bullet-block collision removes both objects and updates score."""
     # Create and add bullet
     bullet = Bullet(x=400, y=500)
@@ -119,29 +105,15 @@ def test_bullet_block_collision_removes_bullet_and_block(game_setup, mock_game_o
 
     # Create and add block with proper rect
     block = Mock()
-    block.get_rect = Mock(
-        return_value=pygame.Rect(400, 450, 32, 16)
-    )  # Position block near bullet
+    block.get_rect = Mock(return_value=block_rect)  # Position block near bullet
     block.get_collision_type = Mock(return_value="block")
     block.handle_collision = Mock()
     game_setup["block_manager"].blocks.append(block)
 
-    # Mock collision detection
-    game_setup["block_manager"].check_collisions = Mock(
-        return_value=(100, 1, [])
-    )  # Score 100, 1 block broken
-    game_setup["game_state"].add_score = Mock(return_value=[])
-
-    controller = GameController(
-        game_setup["game_state"],
-        game_setup["level_manager"],
-        game_setup["ball_manager"],
-        game_setup["paddle"],
-        game_setup["block_manager"],
-        input_manager=game_setup["input_manager"],
-        layout=game_setup["layout"],
-        renderer=game_setup["renderer"],
-        bullet_manager=game_setup["bullet_manager"],
+    # Record collision checks: score 100, 1 block broken
+    check_collisions = _recorder((100, 1, []))
+    monkeypatch.setattr(
+        game_setup["block_manager"], "check_collisions", check_collisions
     )
 
     # Update game state
@@ -151,5 +123,5 @@ def test_bullet_block_collision_removes_bullet_and_block(game_setup, mock_game_o
     assert (
         bullet in controller.bullet_manager.bullets
     ), "Bullet should remain if still active"
-    game_setup["block_manager"].check_collisions.assert_called_with(bullet)
+    assert check_collisions.calls[-1] == ((bullet,), {})
     game_setup["game_state"].add_score.assert_called_with(100)
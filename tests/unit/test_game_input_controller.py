@@ -1,5 +1,6 @@
 """Tests for the GameInputController class."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pygame
@@ -17,29 +18,36 @@ from xboing.engine.input import InputManager
 from xboing.game.ball_manager import BallManager
 from xboing.game.block_manager import BlockManager
 from xboing.game.bullet_manager import BulletManager
-from xboing.game.game_state import GameState
 from xboing.game.level_manager import LevelManager
 from xboing.game.paddle import Paddle
-from xboing.layout.game_layout import GameLayout
+
+# Spec attribute names resolved once; Mock(spec=<list>) skips class introspection.
+_LEVEL_MANAGER_SPEC = dir(LevelManager)
+_BALL_MANAGER_SPEC = dir(BallManager)
+_PADDLE_SPEC = dir(Paddle)
+_BLOCK_MANAGER_SPEC = dir(BlockManager)
+_BULLET_MANAGER_SPEC = dir(BulletManager)
+_INPUT_MANAGER_SPEC = dir(InputManager)
 
 
 @pytest.fixture
 def mock_game_state():
     """Create a mock game state for testing."""
-    game_state = Mock(spec=GameState)
-    game_state.ammo = 5
-    game_state.fire_ammo.return_value = []
-    level_state = Mock()
-    level_state.get_bonus_time.return_value = 120
-    game_state.level_state = level_state
-    game_state.set_timer.return_value = []
-    return game_state
+    # Plain values and functions; Mocks only where tests assert on calls
+    return SimpleNamespace(
+        ammo=5,
+        fire_ammo=Mock(return_value=[]),
+        set_timer=Mock(return_value=[]),
+        level_state=SimpleNamespace(
+            get_bonus_time=lambda: 120, set_level_complete=Mock()
+        ),
+    )
 
 
 @pytest.fixture
 def mock_level_manager():
     """Create a mock level manager for testing."""
-    level_manager = Mock(spec=LevelManager)
+    level_manager = Mock(spec=_LEVEL_MANAGER_SPEC)
     level_manager.get_level_info.return_value = {"title": "Test Level"}
     return level_manager
 
@@ -47,7 +55,7 @@ def mock_level_manager():
 @pytest.fixture
 def mock_ball_manager():
     """Create a mock ball manager for testing."""
-    ball_manager = Mock(spec=BallManager)
+    ball_manager = Mock(spec=_BALL_MANAGER_SPEC)
     ball_manager.has_ball_in_play.return_value = False
     ball = Mock()
     ball.stuck_to_paddle = True
@@ -58,16 +66,15 @@ def mock_ball_manager():
 @pytest.fixture
 def mock_paddle():
     """Create a mock paddle for testing."""
-    paddle = Mock(spec=Paddle)
-    paddle.rect.centerx = 400
-    paddle.rect.top = 500
+    paddle = Mock(spec=_PADDLE_SPEC)
+    paddle.rect = Mock(centerx=400, top=500)
     return paddle
 
 
 @pytest.fixture
 def mock_block_manager():
     """Create a mock block manager for testing."""
-    block_manager = Mock(spec=BlockManager)
+    block_manager = Mock(spec=_BLOCK_MANAGER_SPEC)
     block_manager.blocks = []
     return block_manager
 
@@ -75,26 +82,25 @@ def mock_block_manager():
 @pytest.fixture
 def mock_bullet_manager():
     """Create a mock bullet manager for testing."""
-    bullet_manager = Mock(spec=BulletManager)
+    bullet_manager = Mock(spec=_BULLET_MANAGER_SPEC)
     return bullet_manager
 
 
 @pytest.fixture
 def mock_input_manager():
     """Create a mock input manager for testing."""
-    input_manager = Mock(spec=InputManager)
+    input_manager = Mock(spec=_INPUT_MANAGER_SPEC)
     return input_manager
 
 
 @pytest.fixture
-def mock_layout():
+def mock_layout(play_rect):
     """Create a mock layout for testing."""
-    layout = Mock(spec=GameLayout)
-    return layout
+    return SimpleNamespace(get_play_rect=lambda: play_rect)
 
 
 @pytest.fixture
-def controller(
+def mocks(
     mock_game_state,
     mock_level_manager,
     mock_ball_manager,
@@ -104,79 +110,71 @@ def controller(
     mock_input_manager,
     mock_layout,
 ):
+    """Bundle the collaborator mocks for the controller and the tests."""
+    return SimpleNamespace(
+        game_state=mock_game_state,
+        level_manager=mock_level_manager,
+        ball_manager=mock_ball_manager,
+        paddle=mock_paddle,
+        block_manager=mock_block_manager,
+        bullet_manager=mock_bullet_manager,
+        input_manager=mock_input_manager,
+        layout=mock_layout,
+    )
+
+
+@pytest.fixture
+def controller(mocks):
     """Create a GameInputController for testing."""
     return GameInputController(
-        mock_game_state,
-        mock_level_manager,
-        mock_ball_manager,
-        mock_paddle,
-        mock_block_manager,
-        mock_bullet_manager,
-        mock_input_manager,
-        mock_layout,
+        mocks.game_state,
+        mocks.level_manager,
+        mocks.ball_manager,
+        mocks.paddle,
+        mocks.block_manager,
+        mocks.bullet_manager,
+        mocks.input_manager,
+        mocks.layout,
     )
 
 
-def test_initialization(
-    controller,
-    mock_game_state,
-    mock_level_manager,
-    mock_ball_manager,
-    mock_paddle,
-    mock_block_manager,
-    mock_bullet_manager,
-    mock_input_manager,
-    mock_layout,
-):
+def test_initialization(controller, mocks):
     """Test that the controller is initialized correctly."""
-    assert controller.game_state == mock_game_state
-    assert controller.level_manager == mock_level_manager
-    assert controller.ball_manager == mock_ball_manager
-    assert controller.paddle == mock_paddle
-    assert controller.block_manager == mock_block_manager
-    assert controller.bullet_manager == mock_bullet_manager
-    assert controller.input_manager == mock_input_manager
-    assert controller.layout == mock_layout
+    assert controller.game_state == mocks.game_state
+    assert controller.level_manager == mocks.level_manager
+    assert controller.ball_manager == mocks.ball_manager
+    assert controller.paddle == mocks.paddle
+    assert controller.block_manager == mocks.block_manager
+    assert controller.bullet_manager == mocks.bullet_manager
+    assert controller.input_manager == mocks.input_manager
+    assert controller.layout == mocks.layout
     assert controller.paused is False
     assert controller.stuck_ball_timer == 0.0
     assert controller.ball_auto_active_delay_ms == 3000.0
 
 
-def test_handle_events_quit(controller):
-    """Test handling quit event."""
-    # Create a quit event
-    quit_event = Mock()
-    quit_event.type = pygame.QUIT
-
-    # Call the method
-    events = controller.handle_events([quit_event])
-
-    # Verify a quit event was returned
-    assert len(events) == 1
-    assert events[0].type == pygame.QUIT
-
+@pytest.mark.parametrize(
+    ("event", "expected_types"),
+    [
+        (SimpleNamespace(type=pygame.QUIT), [pygame.QUIT]),
+        (SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_q), [pygame.QUIT]),
+        # BallLostEvent is already queued for GameController; re-posting it
+        # would duplicate its sound effect
+        (SimpleNamespace(type=pygame.USEREVENT, event=BallLostEvent()), []),
+    ],
+    ids=["quit", "q_key", "ball_lost"],
+)
+def test_handle_events_returned_types(controller, event, expected_types):
+    """Test which events handle_events returns for quit and ball-lost input."""
+    events = controller.handle_events([event])
 
-def test_handle_events_q_key(controller):
-    """Test handling Q key event."""
-    # Create a Q key event
-    q_key_event = Mock()
-    q_key_event.type = pygame.KEYDOWN
-    q_key_event.key = pygame.K_q
-
-    # Call the method
-    events = controller.handle_events([q_key_event])
-
-    # Verify a quit event was returned
-    assert len(events) == 1
-    assert events[0].type == pygame.QUIT
+    assert [e.type for e in events] == expected_types
 
 
 def test_handle_events_p_key(controller):
     """Test handling P key event."""
     # Create a P key event
-    p_key_event = Mock()
-    p_key_event.type = pygame.KEYDOWN
-    p_key_event.key = pygame.K_p
+    p_key_event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_p)
 
     # Call the method
     controller.handle_events([p_key_event])
@@ -189,109 +187,74 @@ def test_handle_events_p_key(controller):
     assert controller.paused is False
 
 
-def test_handle_events_k_key_with_ball_in_play(
-    controller, mock_ball_manager, mock_game_state, mock_bullet_manager
-):
+def test_handle_events_k_key_with_ball_in_play(controller, mocks, k_key_event):
     """Test handling K key event with ball in play."""
     # Set up ball manager to have a ball in play
-    mock_ball_manager.has_ball_in_play.return_value = True
-
-    # Create a K key event
-    k_key_event = Mock()
-    k_key_event.type = pygame.KEYDOWN
-    k_key_event.key = pygame.K_k
+    mocks.ball_manager.has_ball_in_play.return_value = True
 
     # Call the method
     events = controller.handle_events([k_key_event])
 
     # Verify ammo was fired and bullet was created
-    mock_game_state.fire_ammo.assert_called_once()
-    mock_bullet_manager.add_bullet.assert_called_once()
+    mocks.game_state.fire_ammo.assert_called_once()
+    mocks.bullet_manager.add_bullet.assert_called_once()
 
     # Verify AmmoFiredEvent was returned
     assert any(isinstance(getattr(e, "event", None), AmmoFiredEvent) for e in events)
 
 
-def test_handle_events_k_key_without_ball_in_play(
-    controller, mock_ball_manager, mock_game_state
-):
+def test_handle_events_k_key_without_ball_in_play(controller, mocks, k_key_event):
     """Test handling K key event without ball in play."""
     # Set up ball manager to not have a ball in play
-    mock_ball_manager.has_ball_in_play.return_value = False
-
-    # Create a K key event
-    k_key_event = Mock()
-    k_key_event.type = pygame.KEYDOWN
-    k_key_event.key = pygame.K_k
+    mocks.ball_manager.has_ball_in_play.return_value = False
 
     # Call the method
     events = controller.handle_events([k_key_event])
 
     # Verify balls were released
-    for ball in mock_ball_manager.balls:
+    for ball in mocks.ball_manager.balls:
         ball.release_from_paddle.assert_called_once()
 
     # Verify timer was set and BallShotEvent was returned
-    mock_game_state.set_timer.assert_called_once()
+    mocks.game_state.set_timer.assert_called_once()
     assert any(isinstance(getattr(e, "event", None), BallShotEvent) for e in events)
 
 
-def test_handle_events_mouse_button(controller, mock_ball_manager, mock_game_state):
+def test_handle_events_mouse_button(controller, mocks, mouse_button_event):
     """Test handling mouse button event."""
     # Set up ball manager to not have a ball in play
-    mock_ball_manager.has_ball_in_play.return_value = False
-
-    # Create a mouse button event
-    mouse_event = Mock()
-    mouse_event.type = pygame.MOUSEBUTTONDOWN
+    mocks.ball_manager.has_ball_in_play.return_value = False
 
     # Call the method
-    events = controller.handle_events([mouse_event])
+    events = controller.handle_events([mouse_button_event])
 
     # Verify balls were released
-    for ball in mock_ball_manager.balls:
+    for ball in mocks.ball_manager.balls:
         ball.release_from_paddle.assert_called_once()
 
     # Verify timer was set and BallShotEvent was returned
-    mock_game_state.set_timer.assert_called_once()
+    mocks.game_state.set_timer.assert_called_once()
     assert any(isinstance(getattr(e, "event", None), BallShotEvent) for e in events)
 
 
-def test_handle_events_ball_lost(controller):
-    """Test handling BallLostEvent."""
-    # Create a BallLostEvent
-    ball_lost_event = Mock()
-    ball_lost_event.type = pygame.USEREVENT
-    ball_lost_event.event = BallLostEvent()
-
-    # Call the method
-    events = controller.handle_events([ball_lost_event])
-
-    # Verify BallLostEvent is not returned (to avoid duplicate sound effects)
-    # The event is already in the event queue and will be handled by GameController
-    assert len(events) == 0
-
-
-def test_handle_debug_keys_x_key(
-    controller, mock_input_manager, mock_block_manager, mock_game_state
-):
+def test_handle_debug_keys_x_key(controller, mocks):
     """Test handling X key for debug."""
     # Set up input manager to return X key pressed
-    mock_input_manager.is_key_pressed.side_effect = lambda k: k == pygame.K_x
+    mocks.input_manager.is_key_pressed.side_effect = lambda k: k == pygame.K_x
 
     # Add a block to the block manager
     block = Mock()
-    mock_block_manager.blocks = [block]
+    mocks.block_manager.blocks = [block]
 
     # Call the method
     events = controller.handle_debug_keys()
 
     # Verify block was hit and blocks were cleared
     block.hit.assert_called_once()
-    assert mock_block_manager.blocks == []
+    assert mocks.block_manager.blocks == []
 
     # Verify level complete was set and events were returned
-    mock_game_state.level_state.set_level_complete.assert_called_once()
+    mocks.game_state.level_state.set_level_complete.assert_called_once()
     assert len(events) == 2
     assert any(
         isinstance(getattr(e, "event", None), LevelCompleteEvent) for e in events
@@ -299,12 +262,12 @@ def test_handle_debug_keys_x_key(
     assert any(isinstance(getattr(e, "event", None), ApplauseEvent) for e in events)
 
 
-def test_update_stuck_ball_timer_no_stuck_balls(controller, mock_ball_manager):
+def test_update_stuck_ball_timer_no_stuck_balls(controller, mocks):
     """Test updating stuck ball timer with no stuck balls."""
     # Set up ball manager to have no stuck balls
     ball = Mock()
     ball.stuck_to_paddle = False
-    mock_ball_manager.balls = [ball]
+    mocks.ball_manager.balls = [ball]
 
     # Call the method
     events = controller.update_stuck_ball_timer(16.67)
@@ -314,12 +277,12 @@ def test_update_stuck_ball_timer_no_stuck_balls(controller, mock_ball_manager):
     assert len(events) == 0
 
 
-def test_update_stuck_ball_timer_with_stuck_balls(controller, mock_ball_manager):
+def test_update_stuck_ball_timer_with_stuck_balls(controller, mocks):
     """Test updating stuck ball timer with stuck balls."""
     # Set up ball manager to have stuck balls
     ball = Mock()
     ball.stuck_to_paddle = True
-    mock_ball_manager.balls = [ball]
+    mocks.ball_manager.balls = [ball]
 
     # Set timer to just below threshold
     controller.stuck_ball_timer = controller.ball_auto_active_delay_ms - 10
@@ -42,10 +42,8 @@ def test_gameshape_get_rect_and_position():
 
 
 def test_gameshape_draw_called():
-    pygame.init()
     surface = pygame.Surface((50, 50))
     shape = DummyShape(0, 0, 10, 10)
     assert not shape.draw_called
     shape.draw(surface)
     assert shape.draw_called
-    pygame.quit()
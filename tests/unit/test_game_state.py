@@ -1,5 +1,3 @@
-from unittest.mock import patch
-
 import pygame
 import pytest
 
@@ -21,17 +19,28 @@ from xboing.engine.events import (
 )
 from xboing.game.game_state import GameState
 
+_SPECIALS = (
+    ("reverse", SpecialReverseChangedEvent),
+    ("sticky", SpecialStickyChangedEvent),
+    ("save", SpecialSaveChangedEvent),
+    ("fastgun", SpecialFastGunChangedEvent),
+    ("nowall", SpecialNoWallChangedEvent),
+    ("killer", SpecialKillerChangedEvent),
+    ("x2", SpecialX2ChangedEvent),
+    ("x4", SpecialX4ChangedEvent),
+)
+
 
 @pytest.fixture
-def game_state():
-    pygame.init()  # Initialize pygame for events
-    with patch("pygame.event.post") as mock_post:
-        state = GameState()
-        yield state, mock_post
+def game_state(monkeypatch):
+    # Record posted events in a plain list; tests only need the call log
+    posted = []
+    monkeypatch.setattr(pygame.event, "post", posted.append)
+    return GameState(), posted
 
 
 def test_score_event(game_state):
-    state, _mock_post = game_state
+    state, _posted = game_state
     # Test _set_score returns correct event (private method, used for resets)
     changes = state._set_score(42)
     assert len(changes) == 1
@@ -40,7 +49,7 @@ def test_score_event(game_state):
 
 
 def test_lives_event(game_state):
-    state, _mock_post = game_state
+    state, _posted = game_state
     # Test _set_lives returns correct event (private method, used for resets)
     changes = state._set_lives(5)
     assert len(changes) == 1
@@ -49,7 +58,7 @@ def test_lives_event(game_state):
 
 
 def test_level_event(game_state):
-    state, _mock_post = game_state
+    state, _posted = game_state
     # Test set_level returns correct event
     changes = state.set_level(3)
     assert len(changes) == 1
@@ -59,7 +68,7 @@ def test_level_event(game_state):
 
 
 def test_timer_event(game_state):
-    state, _mock_post = game_state
+    state, _posted = game_state
     # Test set_timer returns correct event
     changes = state.set_timer(99)
     assert len(changes) == 1
@@ -68,36 +77,25 @@ def test_timer_event(game_state):
     assert event.time_remaining == 99
 
 
-def test_special_events(game_state):
-    state, _mock_post = game_state
-    specials = [
-        ("reverse", SpecialReverseChangedEvent),
-        ("sticky", SpecialStickyChangedEvent),
-        ("save", SpecialSaveChangedEvent),
-        ("fastgun", SpecialFastGunChangedEvent),
-        ("nowall", SpecialNoWallChangedEvent),
-        ("killer", SpecialKillerChangedEvent),
-        ("x2", SpecialX2ChangedEvent),
-        ("x4", SpecialX4ChangedEvent),
-    ]
-    for name, event_cls in specials:
-        # Test setting special to True
-        changes = state.set_special(name, True)
-        assert len(changes) == 1
-        event = changes[0]
-        assert isinstance(event, event_cls)
-        assert event.active is True
-
-        # Test setting special to False
-        changes = state.set_special(name, False)
-        assert len(changes) == 1
-        event = changes[0]
-        assert isinstance(event, event_cls)
-        assert event.active is False
+@pytest.mark.parametrize("active", [True, False])
+@pytest.mark.parametrize(
+    ("name", "event_cls"), _SPECIALS, ids=[n for n, _ in _SPECIALS]
+)
+def test_special_events(game_state, name, event_cls, active):
+    state, _posted = game_state
+    if not active:
+        # Clearing only emits an event when the special was set
+        state.set_special(name, True)
+
+    changes = state.set_special(name, active)
+    assert len(changes) == 1
+    event = changes[0]
+    assert isinstance(event, event_cls)
+    assert event.active is active
 
 
 def test_game_over_event(game_state):
-    state, _mock_post = game_state
+    state, _posted = game_state
     # Should return GameOverEvent when setting to True
     changes = state.set_game_over(True)
     if not changes:
@@ -146,18 +144,3 @@ def test_ammo_reset_on_restart(game_state):
     dummy_level_manager = DummyLevelManager()
     state.full_restart(dummy_level_manager)
     assert state.ammo == 4
-
-
-def test_ammo_reset_on_full_restart(game_state):
-    state, _ = game_state
-    state.ammo = 0
-
-    class DummyLevelManager:
-        def get_level_info(self):
-            return {"title": "foo"}
-
-        def load_level(self, lvl):
-            pass
-
-    state.full_restart(DummyLevelManager())
-    assert state.ammo == 4
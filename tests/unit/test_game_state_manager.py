@@ -16,6 +16,11 @@ from xboing.game.game_state_manager import GameStateManager
 from xboing.game.level_manager import LevelManager
 
 
+def _has(events, cls):
+    """Return True if any event is exactly of type cls."""
+    return any(type(e) is cls for e in events)
+
+
 @pytest.fixture
 def level_manager():
     """Create a level manager for testing."""
@@ -48,7 +53,7 @@ class TestGameStateManagerLifeLoss:
         assert game_state.lives == initial_lives - 1
 
         # Should return LivesChangedEvent
-        assert any(isinstance(e, LivesChangedEvent) for e in events)
+        assert _has(events, LivesChangedEvent)
 
     def test_no_life_loss_when_active_balls_remain(self, manager, game_state):
         """Test that life is NOT lost when active balls remain."""
@@ -75,7 +80,7 @@ class TestGameStateManagerLifeLoss:
         assert game_state.is_game_over()
 
         # Should return GameOverEvent
-        assert any(isinstance(e, GameOverEvent) for e in events)
+        assert _has(events, GameOverEvent)
 
     def test_no_life_loss_when_already_game_over(self, manager, game_state):
         """Test that no life is lost if game is already over."""
@@ -112,7 +117,7 @@ class TestGameStateManagerLifeLoss:
         events3 = manager.handle_life_loss(has_active_balls=False)
         assert game_state.lives == 0
         assert game_state.is_game_over()
-        assert any(isinstance(e, GameOverEvent) for e in events3)
+        assert _has(events3, GameOverEvent)
 
 
 class TestGameStateManagerLevelComplete:
@@ -126,8 +131,8 @@ class TestGameStateManagerLevelComplete:
         assert game_state.level_state.is_level_complete()
 
         # Should return LevelCompleteEvent and ApplauseEvent
-        assert any(isinstance(e, LevelCompleteEvent) for e in events)
-        assert any(isinstance(e, ApplauseEvent) for e in events)
+        assert _has(events, LevelCompleteEvent)
+        assert _has(events, ApplauseEvent)
         assert len(events) == 2
 
     def test_level_not_complete_when_blocks_remain(self, manager, game_state):
@@ -166,8 +171,9 @@ class TestGameStateManagerTimer:
         events = manager.update_timer(delta_ms=1000.0, is_active=True)
 
         # Timer should have decreased by 1 second
-        assert game_state.level_state.get_bonus_time() < initial_time
-        assert game_state.level_state.get_bonus_time() == initial_time - 1
+        bonus_time = game_state.level_state.get_bonus_time()
+        assert bonus_time < initial_time
+        assert bonus_time == initial_time - 1
 
         # Should return TimerUpdatedEvent
         assert len(events) == 1
@@ -187,20 +193,30 @@ class TestGameStateManagerTimer:
         assert len(events) == 0
 
     def test_timer_countdown(self, manager, game_state):
-        """Test timer countdown over multiple updates."""
+        """Test timer countdown over a multi-second update."""
         # Set initial time
         game_state.level_state.timer = 100  # 100 seconds
         initial_time = game_state.level_state.get_bonus_time()
 
-        # Update multiple times (need >= 1000ms total to see timer decrease)
-        for _ in range(10):
-            events = manager.update_timer(delta_ms=500.0, is_active=True)
-            assert len(events) == 1
+        # The timer consumes whole seconds from the elapsed time, so one 5000ms
+        # update is equivalent to ten 500ms ones
+        events = manager.update_timer(delta_ms=5000.0, is_active=True)
+        assert len(events) == 1
 
-        # Timer should have decreased by approximately 5 seconds (10 * 500ms = 5000ms)
         final_time = game_state.level_state.get_bonus_time()
         assert final_time == initial_time - 5
 
+    def test_timer_accumulates_partial_updates(self, manager, game_state):
+        """Test that sub-second updates accumulate across calls."""
+        game_state.level_state.timer = 100  # 100 seconds
+        initial_time = game_state.level_state.get_bonus_time()
+
+        # Each update reports the timer, but only the second crosses 1000ms
+        for expected_time in (initial_time, initial_time - 1):
+            events = manager.update_timer(delta_ms=500.0, is_active=True)
+            assert len(events) == 1
+            assert events[0].time_remaining == expected_time
+
     def test_timer_event_contains_current_time(self, manager, game_state):
         """Test that timer event contains the current timer value."""
         events = manager.update_timer(delta_ms=100.0, is_active=True)
@@ -312,8 +328,8 @@ class TestGameStateManagerIntegration:
         events = manager.handle_life_loss(has_active_balls=False)
 
         # Should have both life lost and game over events
-        assert any(isinstance(e, LivesChangedEvent) for e in events)
-        assert any(isinstance(e, GameOverEvent) for e in events)
+        assert _has(events, LivesChangedEvent)
+        assert _has(events, GameOverEvent)
         assert manager.is_game_over()
 
         # Trying to lose another life should do nothing
@@ -1,5 +1,4 @@
-import pygame
-import pytest
+from dataclasses import dataclass
 
 from xboing.game.ball_manager import BallManager
 from xboing.game.bullet_manager import BulletManager
@@ -7,25 +6,25 @@ from xboing.renderers.bullet_renderer import BulletRenderer
 from xboing.ui.game_view import GameView
 
 
+@dataclass(slots=True)
 class MockBlockManager:
-    def __init__(self):
-        self.drawn = False
+    drawn: bool = False
 
     def draw(self, surface):
         self.drawn = True
 
 
+@dataclass(slots=True)
 class MockPaddle:
-    def __init__(self):
-        self.drawn = False
+    drawn: bool = False
 
     def draw(self, surface):
         self.drawn = True
 
 
+@dataclass(slots=True)
 class MockBall:
-    def __init__(self):
-        self.drawn = False
+    drawn: bool = False
 
     def draw(self, surface):
         self.drawn = True
@@ -53,15 +52,7 @@ class MockRenderer:
     pass
 
 
-@pytest.fixture(autouse=True)
-def pygame_init():
-    pygame.init()
-    pygame.display.set_mode((1, 1))  # Dummy video mode for image loading
-    yield
-    pygame.quit()
-
-
-def test_game_view_draw():
+def test_game_view_draw(draw_surface):
     block_manager = MockBlockManager()  # type: ignore  # test mock
     paddle = MockPaddle()  # type: ignore  # test mock
     balls = [MockBall(), MockBall()]  # type: ignore  # test mock
@@ -72,9 +63,8 @@ def test_game_view_draw():
     renderer = MockRenderer()  # type: ignore  # test mock
     bullet_manager = BulletManager()
     bullet_renderer = BulletRenderer()
-    surface = pygame.Surface((100, 100))
     view = GameView(layout, block_manager, paddle, ball_manager, renderer, bullet_manager, bullet_renderer)  # type: ignore  # test mock
-    view.draw(surface)
+    view.draw(draw_surface)
     assert block_manager.drawn
     assert paddle.drawn
     assert all(getattr(ball, "drawn", False) for ball in ball_manager.balls)  # type: ignore  # test mock
@@ -1,24 +1,23 @@
 from unittest.mock import create_autospec
 
+from xboing.controllers.game_controller import GameController
 from xboing.controllers.level_complete_controller import LevelCompleteController
+from xboing.game.game_state import GameState
+from xboing.game.level_manager import LevelManager
+from xboing.layout.game_layout import GameLayout
+from xboing.ui.game_view import GameView
 from xboing.ui.ui_manager import UIManager
 
 
-class Dummy:
-    def __getattr__(self, name):
-        """Return a dummy callable for any attribute access (test stub)."""
-        return lambda *args, **kwargs: None
-
-
 def test_level_complete_controller_instantiation_and_methods():
-    # Provide all required arguments as dummies/mocks
-    game_state = Dummy()
-    level_manager = Dummy()
+    # Provide all required arguments as autospecced mocks
+    game_state = create_autospec(GameState, instance=True)
+    level_manager = create_autospec(LevelManager, instance=True)
     balls = []
-    game_controller = Dummy()
+    game_controller = create_autospec(GameController, instance=True)
     ui_manager = create_autospec(UIManager)
-    game_view = Dummy()
-    layout = Dummy()
+    game_view = create_autospec(GameView, instance=True)
+    layout = create_autospec(GameLayout, instance=True)
     controller = LevelCompleteController(
         balls,
         ui_manager,
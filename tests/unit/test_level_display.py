@@ -5,6 +5,8 @@ from xboing.ui.level_display import LevelDisplay
 
 
 class MockDigitRenderer:
+    __slots__ = ("last_kwargs", "last_number", "surface")
+
     def __init__(self):
         self.last_number = None
         self.last_kwargs = None
@@ -6,36 +6,68 @@ import pytest
 from xboing.renderers.lives_renderer import LivesRenderer
 
 
+class _FakeSurface:
+    """Plain stand-in for the few pygame.Surface methods the renderer uses."""
+
+    __slots__ = ("blit_calls", "h", "w")
+
+    def __init__(self, size, flags=0):
+        self.w, self.h = size
+        self.blit_calls = []
+
+    def get_width(self):
+        return self.w
+
+    def get_height(self):
+        return self.h
+
+    def blit(self, img, pos):
+        self.blit_calls.append(pos)
+
+    def convert_alpha(self):
+        return self
+
+
 @pytest.fixture(autouse=True)
 def patch_pygame(monkeypatch):
-    # Mock for the ball image with correct get_width/get_height
-    mock_ball_image = mock.MagicMock()
-    mock_ball_image.get_width.return_value = 10
-    mock_ball_image.get_height.return_value = 10
-    # convert_alpha returns the same mock
-    mock_ball_image.convert_alpha.return_value = mock_ball_image
-    monkeypatch.setattr("pygame.image.load", lambda path: mock_ball_image)
-    # Patch pygame.Surface to return a new mock for each call
+    # Fake ball image; convert_alpha returns the same object
+    ball_image = _FakeSurface((10, 10))
+    monkeypatch.setattr("pygame.image.load", lambda path: ball_image)
+    # Patch pygame.Surface to return a new fake for each call
     surface_mocks = []
 
     def surface_factory(size, flags=0):
-        s = mock.MagicMock()
-        s.get_width.return_value = size[0]
-        s.get_height.return_value = size[1]
+        s = _FakeSurface(size)
         surface_mocks.append((s, size))
         return s
 
     monkeypatch.setattr("pygame.Surface", surface_factory)
+    monkeypatch.setattr("pygame.transform.smoothscale", lambda img, size: ball_image)
+    return surface_mocks
+
+
+@pytest.fixture
+def renderer(patch_pygame):
+    """Create a LivesRenderer against the patched pygame surfaces."""
+    return LivesRenderer()
+
+
+@pytest.fixture
+def missing_image_env(monkeypatch):
+    """Patch pygame so the ball image cannot be found or loaded."""
+    # Patch image load to always fail
     monkeypatch.setattr(
-        "pygame.transform.smoothscale", lambda img, size: mock_ball_image
+        "pygame.image.load", lambda path: (_ for _ in ()).throw(FileNotFoundError())
     )
-    return surface_mocks
+    monkeypatch.setattr("os.path.exists", lambda path: False)
+    # Patch pygame.Surface to return a new mock
+    monkeypatch.setattr("pygame.Surface", lambda size, flags=0: mock.MagicMock())
+    return monkeypatch
 
 
-def test_render_surface_size_and_visibility(monkeypatch, patch_pygame):
-    display = LivesRenderer()
+def test_render_surface_size_and_visibility(renderer, patch_pygame):
     patch_pygame.clear()  # Clear any previous calls
-    surf = display.render(num_lives=2, spacing=5, scale=1.0, max_lives=3)
+    surf = renderer.render(num_lives=2, spacing=5, scale=1.0, max_lives=3)
     # Surface size: (ball_width * max_lives) + (spacing * (max_lives-1))
     expected_width = (10 * 3) + (5 * 2)
     expected_height = 10
@@ -48,15 +80,13 @@ def test_render_surface_size_and_visibility(monkeypatch, patch_pygame):
     assert surf is not None
 
 
-def test_render_all_visible(monkeypatch, patch_pygame):
-    display = LivesRenderer()
-    surf = display.render(num_lives=3, spacing=2, scale=1.0, max_lives=3)
+def test_render_all_visible(renderer):
+    surf = renderer.render(num_lives=3, spacing=2, scale=1.0, max_lives=3)
     assert surf is not None
 
 
-def test_render_none_visible(monkeypatch, patch_pygame):
-    display = LivesRenderer()
-    surf = display.render(num_lives=0, spacing=2, scale=1.0, max_lives=3)
+def test_render_none_visible(renderer):
+    surf = renderer.render(num_lives=0, spacing=2, scale=1.0, max_lives=3)
     assert surf is not None
 
 
@@ -74,27 +104,14 @@ def test_cache(monkeypatch, patch_pygame):
     assert (1, 4, 1.0, 3) in display._surface_cache
 
 
-def test_fallback_empty_surface(monkeypatch):
-    # Patch image load to always fail
-    monkeypatch.setattr(
-        "pygame.image.load", lambda path: (_ for _ in ()).throw(FileNotFoundError())
-    )
-    monkeypatch.setattr("os.path.exists", lambda path: False)
-    # Patch pygame.Surface to return a new mock
-    monkeypatch.setattr("pygame.Surface", lambda size, flags=0: mock.MagicMock())
+def test_fallback_empty_surface(missing_image_env):
     display = LivesRenderer()
     surf = display.render(2, 4, 1.0, 3)
     # Should return a mock surface (empty)
     assert surf is not None
 
 
-def test_logging_warning_for_missing_image(monkeypatch, caplog):
-    monkeypatch.setattr(
-        "pygame.image.load", lambda path: (_ for _ in ()).throw(FileNotFoundError())
-    )
-    monkeypatch.setattr("os.path.exists", lambda path: False)
-    # Patch pygame.Surface to return a new mock
-    monkeypatch.setattr("pygame.Surface", lambda size, flags=0: mock.MagicMock())
+def test_logging_warning_for_missing_image(missing_image_env, caplog):
     with caplog.at_level(logging.WARNING, logger="xboing.lives_display"):
         display = LivesRenderer()
         assert display is not None
@@ -1,4 +1,5 @@
 import pygame
+import pytest
 
 from xboing.engine.events import LivesChangedEvent
 from xboing.ui.lives_display import LivesDisplayComponent
@@ -33,49 +34,26 @@ class DummyLayout:
         return pygame.Rect(0, 0, 200, 40)
 
 
-def test_lives_display_initial_state():
+@pytest.mark.parametrize(
+    ("lives_updates", "expected_lives"),
+    [([], 3), ([2], 2), ([2, 3], 3)],
+    ids=["initial_state", "loss", "gain"],
+)
+def test_lives_display(lives_updates, expected_lives):
     layout = DummyLayout()  # type: ignore
     util = MockLivesRendererUtil()  # type: ignore
     comp = LivesDisplayComponent(layout, util, x=10, max_lives=3)  # type: ignore
-    assert comp.lives == 3
-    comp.draw(pygame.Surface((200, 40)))
-    assert util.last_lives == 3
-    assert util.last_kwargs is not None
-    assert util.last_kwargs["max_lives"] == 3
-
-
-def test_lives_display_loss():
-    layout = DummyLayout()  # type: ignore
-    util = MockLivesRendererUtil()  # type: ignore
-    comp = LivesDisplayComponent(layout, util, x=10, max_lives=3)  # type: ignore
-
-    # Create a pygame event with a LivesChangedEvent
-    event = pygame.event.Event(pygame.USEREVENT, {"event": LivesChangedEvent(2)})
-    comp.handle_events([event])
-
-    assert comp.lives == 2
-    comp.draw(pygame.Surface((200, 40)))
-    assert util.last_lives == 2
-    assert util.last_kwargs is not None
-    assert util.last_kwargs["max_lives"] == 3
-
-
-def test_lives_display_gain():
-    layout = DummyLayout()  # type: ignore
-    util = MockLivesRendererUtil()  # type: ignore
-    comp = LivesDisplayComponent(layout, util, x=10, max_lives=3)  # type: ignore
-
-    # Create a pygame event with a LivesChangedEvent for loss
-    event_loss = pygame.event.Event(pygame.USEREVENT, {"event": LivesChangedEvent(2)})
-    comp.handle_events([event_loss])
-    assert comp.lives == 2
 
-    # Create a pygame event with a LivesChangedEvent for gain
-    event_gain = pygame.event.Event(pygame.USEREVENT, {"event": LivesChangedEvent(3)})
-    comp.handle_events([event_gain])
-    assert comp.lives == 3
+    # Post each LivesChangedEvent in turn, checking the count follows it
+    for lives in lives_updates:
+        event = pygame.event.Event(
+            pygame.USEREVENT, {"event": LivesChangedEvent(lives)}
+        )
+        comp.handle_events([event])
+        assert comp.lives == lives
 
+    assert comp.lives == expected_lives
     comp.draw(pygame.Surface((200, 40)))
-    assert util.last_lives == 3
+    assert util.last_lives == expected_lives
     assert util.last_kwargs is not None
     assert util.last_kwargs["max_lives"] == 3
@@ -1,17 +1,9 @@
 import pygame
-import pytest
 
 from xboing.engine.events import MessageChangedEvent
 from xboing.ui.message_display import MessageDisplay
 
 
-@pytest.fixture(autouse=True, scope="module")
-def pygame_init_and_quit():
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 class DummyRenderer:
     def __init__(self):
         self.last_args = None
@@ -25,11 +17,10 @@ class DummyLayout:
         return pygame.Rect(0, 0, 200, 40)
 
 
-def test_message_display_initial_state():
+def test_message_display_initial_state(default_font):
     layout = DummyLayout()
     renderer = DummyRenderer()
-    font = pygame.font.Font(None, 24)
-    comp = MessageDisplay(layout, renderer, font)  # type: ignore[arg-type]  # test stub
+    comp = MessageDisplay(layout, renderer, default_font)  # type: ignore[arg-type]  # test stub
     assert comp.message == ""
     assert comp.alignment == "left"
     comp.draw(pygame.Surface((200, 40)))
@@ -38,11 +29,10 @@ def test_message_display_initial_state():
     assert renderer.last_args[2] == (0, 255, 0)
 
 
-def test_message_display_updates_on_event():
+def test_message_display_updates_on_event(default_font):
     layout = DummyLayout()
     renderer = DummyRenderer()
-    font = pygame.font.Font(None, 24)
-    comp = MessageDisplay(layout, renderer, font)  # type: ignore[arg-type]  # test stub
+    comp = MessageDisplay(layout, renderer, default_font)  # type: ignore[arg-type]  # test stub
 
     # Create a pygame event with a MessageChangedEvent
     event = pygame.event.Event(
@@ -1,7 +1,6 @@
 """Tests for PowerUpManager."""
 
-import logging
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -26,6 +25,22 @@ from xboing.game.game_state import GameState
 from xboing.game.paddle import Paddle
 from xboing.game.power_up_manager import PowerUpManager
 
+# Paddle size effects: event type and the flag it sets on reaching the limit
+_SIZE_EFFECTS = {
+    PAD_EXPAND_BLK: (PaddleGrowEvent, "at_max"),
+    PAD_SHRINK_BLK: (PaddleShrinkEvent, "at_min"),
+}
+_SMALL, _MEDIUM, _LARGE = Paddle.SIZE_SMALL, Paddle.SIZE_MEDIUM, Paddle.SIZE_LARGE
+# (start size, power-up block, end size, at limit afterwards)
+_SIZE_TRANSITIONS = [
+    (_SMALL, PAD_EXPAND_BLK, _MEDIUM, False),
+    (_MEDIUM, PAD_EXPAND_BLK, _LARGE, True),
+    (_LARGE, PAD_EXPAND_BLK, _LARGE, True),
+    (_LARGE, PAD_SHRINK_BLK, _MEDIUM, False),
+    (_MEDIUM, PAD_SHRINK_BLK, _SMALL, True),
+    (_SMALL, PAD_SHRINK_BLK, _SMALL, True),
+]
+
 
 @pytest.fixture
 def paddle():
@@ -45,9 +60,9 @@ def manager(game_state, paddle):
     return PowerUpManager(game_state, paddle)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dummy_block():
-    """Create a dummy block for testing (unused, so using Mock)."""
+    """Create a dummy block for testing (unused, so shared across the session)."""
     return Mock()
 
 
@@ -112,77 +127,31 @@ class TestPowerUpManagerAmmoEffect:
 class TestPowerUpManagerPaddleSizeEffects:
     """Tests for paddle size power-up effects."""
 
-    def test_paddle_grow_increases_size(self, manager, paddle, dummy_block):
-        """Test that paddle grow increases paddle size."""
-        paddle.set_size(Paddle.SIZE_MEDIUM)
-        initial_size = paddle.size
-
-        events = manager.handle_power_up_effect(PAD_EXPAND_BLK, dummy_block)
-
-        assert paddle.size == initial_size + 1
-        assert any(isinstance(e, PaddleGrowEvent) for e in events)
-
-    def test_paddle_grow_at_max_size(self, manager, paddle, dummy_block):
-        """Test paddle grow when already at maximum size."""
-        paddle.set_size(Paddle.SIZE_LARGE)
-
-        events = manager.handle_power_up_effect(PAD_EXPAND_BLK, dummy_block)
-
-        # Size should stay at max
-        assert paddle.size == Paddle.SIZE_LARGE
-
-        # Event should indicate at_max
-        assert len(events) == 1
-        grow_event = events[0]
-        assert isinstance(grow_event, PaddleGrowEvent)
-        assert grow_event.at_max is True
-
-    def test_paddle_shrink_decreases_size(self, manager, paddle, dummy_block):
-        """Test that paddle shrink decreases paddle size."""
-        paddle.set_size(Paddle.SIZE_MEDIUM)
-        initial_size = paddle.size
-
-        events = manager.handle_power_up_effect(PAD_SHRINK_BLK, dummy_block)
-
-        assert paddle.size == initial_size - 1
-        assert any(isinstance(e, PaddleShrinkEvent) for e in events)
-
-    def test_paddle_shrink_at_min_size(self, manager, paddle, dummy_block):
-        """Test paddle shrink when already at minimum size."""
-        paddle.set_size(Paddle.SIZE_SMALL)
-
-        events = manager.handle_power_up_effect(PAD_SHRINK_BLK, dummy_block)
-
-        # Size should stay at min
-        assert paddle.size == Paddle.SIZE_SMALL
-
-        # Event should indicate at_min
+    @pytest.mark.parametrize(
+        "transition",
+        _SIZE_TRANSITIONS,
+        ids=[
+            "grow_small",
+            "grow_medium",
+            "grow_at_max",
+            "shrink_large",
+            "shrink_medium",
+            "shrink_at_min",
+        ],
+    )
+    def test_paddle_size_transition(self, manager, paddle, dummy_block, transition):
+        """Test each paddle size transition and its limit flag."""
+        start_size, block, end_size, at_limit = transition
+        event_cls, limit_flag = _SIZE_EFFECTS[block]
+        paddle.set_size(start_size)
+
+        events = manager.handle_power_up_effect(block, dummy_block)
+
+        # Size only changes within bounds; the event flags reaching a limit
+        assert paddle.size == end_size
         assert len(events) == 1
-        shrink_event = events[0]
-        assert isinstance(shrink_event, PaddleShrinkEvent)
-        assert shrink_event.at_min is True
-
-    def test_paddle_size_transitions(self, manager, paddle, dummy_block):
-        """Test paddle size transitions through all sizes."""
-        # Start at small
-        paddle.set_size(Paddle.SIZE_SMALL)
-        assert paddle.size == Paddle.SIZE_SMALL
-
-        # Grow to medium
-        manager.handle_power_up_effect(PAD_EXPAND_BLK, dummy_block)
-        assert paddle.size == Paddle.SIZE_MEDIUM
-
-        # Grow to large
-        manager.handle_power_up_effect(PAD_EXPAND_BLK, dummy_block)
-        assert paddle.size == Paddle.SIZE_LARGE
-
-        # Shrink to medium
-        manager.handle_power_up_effect(PAD_SHRINK_BLK, dummy_block)
-        assert paddle.size == Paddle.SIZE_MEDIUM
-
-        # Shrink to small
-        manager.handle_power_up_effect(PAD_SHRINK_BLK, dummy_block)
-        assert paddle.size == Paddle.SIZE_SMALL
+        assert isinstance(events[0], event_cls)
+        assert getattr(events[0], limit_flag) is at_limit
 
 
 class TestPowerUpManagerReverseEffect:
@@ -364,13 +333,14 @@ class TestPowerUpManagerReset:
         manager.reset_power_ups()  # Should not raise
         manager.reset_power_ups()  # Should not raise again
 
-    def test_reset_logs_message(self, manager, caplog):
+    def test_reset_logs_message(self, manager):
         """Test that reset logs a message."""
-        caplog.set_level(logging.DEBUG)
+        with patch.object(manager.logger, "debug") as debug:
+            manager.reset_power_ups()
 
-        manager.reset_power_ups()
-
-        assert "All power-ups reset" in caplog.text
+        assert any(
+            "All power-ups reset" in str(call.args[0]) for call in debug.call_args_list
+        )
 
 
 class TestPowerUpManagerIntegration:
@@ -102,14 +102,12 @@ def test_updateable_protocol():
     assert obj.update(16.67) == []
 
 
-def test_drawable_protocol():
+def test_drawable_protocol(draw_surface):
     """Test that the Drawable protocol works correctly."""
     obj = MockDrawable()
     assert isinstance(obj, Drawable)
-    # Create a mock surface for testing
-    surface = pygame.Surface((100, 100))
     # This should not raise an exception
-    obj.draw(surface)
+    obj.draw(draw_surface)
 
 
 def test_collidable_protocol():
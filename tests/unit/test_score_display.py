@@ -1,10 +1,13 @@
 import pygame
+import pytest
 
 from xboing.engine.events import ScoreChangedEvent
 from xboing.ui.score_display import ScoreDisplay
 
 
 class MockDigitRenderer:
+    __slots__ = ("last_kwargs", "last_number", "surface")
+
     def __init__(self):
         self.last_number = None
         self.last_kwargs = None
@@ -25,60 +28,28 @@ class DummyLayout:
         return pygame.Rect(0, 0, 200, 40)
 
 
-def test_score_display_initial_state():
+@pytest.mark.parametrize(
+    ("score_updates", "expected_score"),
+    [([], 0), ([7], 7), ([12345], 12345), ([999999], 999999)],
+    ids=["initial_state", "small", "medium", "large"],
+)
+def test_score_display_renders_score(score_surface, score_updates, expected_score):
     layout = DummyLayout()
     digit_display = MockDigitRenderer()
     score_display = ScoreDisplay(layout, digit_display, x=10, width=6)
     assert score_display.score == 0
-    # Should render with width=6, right_justified=True
-    score_display.draw(pygame.Surface((200, 40)))
-    assert digit_display.last_number == 0
-    assert digit_display.last_kwargs is not None
-    assert digit_display.last_kwargs["width"] == 6
-    assert digit_display.last_kwargs["right_justified"] is True
 
+    # Post each ScoreChangedEvent in turn, checking the score follows it
+    for score in score_updates:
+        event = pygame.event.Event(
+            pygame.USEREVENT, {"event": ScoreChangedEvent(score)}
+        )
+        score_display.handle_events([event])
+        assert score_display.score == score
 
-def test_score_display_updates_on_event():
-    layout = DummyLayout()
-    digit_display = MockDigitRenderer()
-    score_display = ScoreDisplay(layout, digit_display, x=10, width=6)
-
-    # Create a pygame event with a ScoreChangedEvent
-    event = pygame.event.Event(pygame.USEREVENT, {"event": ScoreChangedEvent(12345)})
-    score_display.handle_events([event])
-
-    assert score_display.score == 12345
-    # Draw should use the updated score
-    score_display.draw(pygame.Surface((200, 40)))
-    assert digit_display.last_number == 12345
-    assert digit_display.last_kwargs is not None
-    assert digit_display.last_kwargs["width"] == 6
-    assert digit_display.last_kwargs["right_justified"] is True
-
-
-def test_score_display_right_justification():
-    layout = DummyLayout()
-    digit_display = MockDigitRenderer()
-    score_display = ScoreDisplay(layout, digit_display, x=10, width=6)
-
-    # Create a pygame event with a ScoreChangedEvent for a small number
-    event_small = pygame.event.Event(pygame.USEREVENT, {"event": ScoreChangedEvent(7)})
-    score_display.handle_events([event_small])
-
-    score_display.draw(pygame.Surface((200, 40)))
-    assert digit_display.last_number == 7
-    assert digit_display.last_kwargs is not None
-    assert digit_display.last_kwargs["width"] == 6
-    assert digit_display.last_kwargs["right_justified"] is True
-
-    # Create a pygame event with a ScoreChangedEvent for a large number
-    event_large = pygame.event.Event(
-        pygame.USEREVENT, {"event": ScoreChangedEvent(999999)}
-    )
-    score_display.handle_events([event_large])
-
-    score_display.draw(pygame.Surface((200, 40)))
-    assert digit_display.last_number == 999999
+    # Should render the current score with width=6, right_justified=True
+    score_display.draw(score_surface)
+    assert digit_display.last_number == expected_score
     assert digit_display.last_kwargs is not None
     assert digit_display.last_kwargs["width"] == 6
     assert digit_display.last_kwargs["right_justified"] is True
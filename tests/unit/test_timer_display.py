@@ -5,14 +5,9 @@ from xboing.engine.events import TimerUpdatedEvent
 from xboing.ui.timer_display import TimerDisplay
 
 
-@pytest.fixture(autouse=True, scope="module")
-def pygame_init_and_quit():
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 class MockDigitRenderer:
+    __slots__ = ("last_kwargs", "last_time", "surface")
+
     def __init__(self):
         self.last_time = None
         self.last_kwargs = None
@@ -51,26 +46,25 @@ class DummyLayout:
         return self.time_window.rect.rect
 
 
-def test_timer_display_initial_state():
+@pytest.mark.parametrize(
+    ("time_updates", "expected"),
+    [([], "00:00"), ([0], "00:00"), ([77], "01:17")],
+    ids=["initial_state", "zero", "update"],
+)
+def test_timer_display_renders_time(
+    default_font, timer_surface, time_updates, expected
+):
     layout = DummyLayout()  # type: ignore  # test stub, not a real GameLayout
     renderer = DummyRenderer()  # type: ignore  # test stub, not a real Renderer
-    font = pygame.font.Font(None, 24)
-    comp = TimerDisplay(layout, renderer, font)  # type: ignore
+    comp = TimerDisplay(layout, renderer, default_font)  # type: ignore
     assert comp.time_remaining == 0
-    comp.draw(pygame.Surface((100, 30)))
-    assert renderer.last_args is not None
-    assert renderer.last_args[0] == "00:00"
-
-
-def test_timer_display_updates_on_event():
-    layout = DummyLayout()  # type: ignore  # test stub, not a real GameLayout
-    renderer = DummyRenderer()  # type: ignore  # test stub, not a real Renderer
-    font = pygame.font.Font(None, 24)
-    comp = TimerDisplay(layout, renderer, font)  # type: ignore
-    # Create a pygame event with a TimerUpdatedEvent
-    event = pygame.event.Event(pygame.USEREVENT, {"event": TimerUpdatedEvent(77)})
-    comp.handle_events([event])
-    assert comp.time_remaining == 77
-    comp.draw(pygame.Surface((100, 30)))
+    # Post each TimerUpdatedEvent in turn, checking the time follows it
+    for seconds in time_updates:
+        event = pygame.event.Event(
+            pygame.USEREVENT, {"event": TimerUpdatedEvent(seconds)}
+        )
+        comp.handle_events([event])
+        assert comp.time_remaining == seconds
+    comp.draw(timer_surface)
     assert renderer.last_args is not None
-    assert renderer.last_args[0] == "01:17"
+    assert renderer.last_args[0] == expected
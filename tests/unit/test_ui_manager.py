@@ -1,18 +1,78 @@
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import pygame
+import pytest
 
 from xboing.ui.ui_manager import UIManager
 
 
-def test_ui_manager_registration_and_draw_order():
-    ui_manager = UIManager()
-    # Create mocks for bars and views
-    top_bar = Mock()
-    bottom_bar = Mock()
-    view1 = Mock()
-    view2 = Mock()
-    surface = Mock()
+class StubBar:
+    """Top/bottom bar stand-in that logs draw and handle_events calls."""
+
+    __slots__ = ("log", "name")
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def draw(self, surface):
+        self.log.append((self.name, "draw", surface))
+
+    def handle_events(self, events):
+        self.log.append((self.name, "handle_events", events))
+
+
+class StubView:
+    """Content view stand-in that logs draw calls."""
+
+    __slots__ = ("log", "name")
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def activate(self):
+        pass
+
+    def deactivate(self):
+        pass
+
+    def draw(self, surface):
+        self.log.append((self.name, "draw", surface))
+
+
+@pytest.fixture
+def ui_stubs():
+    """Provide fresh stubs for the bars and two views, sharing one call log."""
+    log = []
+    return SimpleNamespace(
+        log=log,
+        top_bar=StubBar("top_bar", log),
+        bottom_bar=StubBar("bottom_bar", log),
+        view1=StubView("view1", log),
+        view2=StubView("view2", log),
+    )
+
+
+@pytest.fixture(scope="module")
+def fake_events():
+    """Provide a user event and a keydown that the bars receive unchanged."""
+    return [
+        SimpleNamespace(type=pygame.USEREVENT, event=None),
+        SimpleNamespace(type=pygame.KEYDOWN, event=None),
+    ]
+
+
+@pytest.fixture
+def ui_manager():
+    """Create a UIManager for testing."""
+    return UIManager()
+
+
+def test_ui_manager_registration_and_draw_order(ui_manager, ui_stubs):
+    top_bar, bottom_bar = ui_stubs.top_bar, ui_stubs.bottom_bar
+    view1, view2 = ui_stubs.view1, ui_stubs.view2
+    surface = object()  # Opaque token; draw calls are only checked by identity
 
     # Register bars and views
     ui_manager.register_top_bar(top_bar)
@@ -21,53 +81,43 @@ def test_ui_manager_registration_and_draw_order():
     ui_manager.register_view("instructions", view2)
 
     # Initial view should be 'game'
-    assert ui_manager.current_view is view1
-    assert ui_manager.current_name == "game"
+    assert (ui_manager.current_view, ui_manager.current_name) == (view1, "game")
 
     # Switch to 'instructions' view
     ui_manager.set_view("instructions")
-    assert ui_manager.current_view is view2
-    assert ui_manager.current_name == "instructions"
+    assert (ui_manager.current_view, ui_manager.current_name) == (view2, "instructions")
 
     # Draw all
     ui_manager.draw_all(surface)
-    view2.draw.assert_called_once_with(surface)
-    top_bar.draw.assert_called_once_with(surface)
-    bottom_bar.draw.assert_called_once_with(surface)
-
-
-def test_ui_manager_setup_ui_and_event_handling():
-    ui_manager = UIManager()
-    # Create mocks for bars and views
-    top_bar = Mock()
-    bottom_bar = Mock()
-    view1 = Mock()
-    view2 = Mock()
-
-    # Add handle_events to mocks
-    top_bar.handle_events = Mock()
-    bottom_bar.handle_events = Mock()
-    # Use setup_ui
+    # Current view first, then the bars drawn over it
+    assert ui_stubs.log == [
+        ("view2", "draw", surface),
+        ("top_bar", "draw", surface),
+        ("bottom_bar", "draw", surface),
+    ]
+
+
+def test_ui_manager_setup_ui_and_event_handling(ui_manager, ui_stubs, fake_events):
+    top_bar, bottom_bar = ui_stubs.top_bar, ui_stubs.bottom_bar
+    view1, view2 = ui_stubs.view1, ui_stubs.view2
+
+    # Register everything through setup_ui on an empty manager
     ui_manager.setup_ui(
         views={"game": view1, "instructions": view2},
         top_bar=top_bar,
         bottom_bar=bottom_bar,
         initial_view="game",
     )
-    assert ui_manager.current_view is view1
-    assert ui_manager.current_name == "game"
+    assert (ui_manager.top_bar, ui_manager.bottom_bar) == (top_bar, bottom_bar)
+    assert ui_manager.views == {"game": view1, "instructions": view2}
+    assert (ui_manager.current_view, ui_manager.current_name) == (view1, "game")
     # Switch view
     ui_manager.set_view("instructions")
-    assert ui_manager.current_view is view2
-    # Test handle_events with mock Pygame events
-    fake_event1 = Mock()
-    fake_event1.type = pygame.USEREVENT
-    fake_event1.event = None
-    fake_event2 = Mock()
-    fake_event2.type = pygame.KEYDOWN
-    fake_event2.event = None
-    fake_events = [fake_event1, fake_event2]
+    assert (ui_manager.current_view, ui_manager.current_name) == (view2, "instructions")
+    # Test handle_events with fake Pygame events
     ui_manager.handle_events(fake_events)
     # Should call handle_events on top_bar and bottom_bar
-    top_bar.handle_events.assert_called_once_with(fake_events)
-    bottom_bar.handle_events.assert_called_once_with(fake_events)
+    assert ui_stubs.log == [
+        ("top_bar", "handle_events", fake_events),
+        ("bottom_bar", "handle_events", fake_events),
+    ]